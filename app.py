@@ -1,7 +1,14 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
 import joblib
+import numpy as np
+from scipy.sparse.linalg import norm as sparse_norm
+from scipy.special import expit
 import os
 import sys
 from dotenv import load_dotenv
@@ -25,13 +32,13 @@ except ImportError:
     logger.warning("⚠️ Gemini AI not available")
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
-    logger.info("✅ Requests library available")
+    import httpx
+    HTTPX_AVAILABLE = True
+    logger.info("✅ HTTPX library available")
 except ImportError:
-    REQUESTS_AVAILABLE = False
-    requests = None
-    logger.warning("⚠️ Requests library not available")
+    HTTPX_AVAILABLE = False
+    httpx = None
+    logger.warning("⚠️ HTTPX library not available")
 
 try:
     from deep_translator import GoogleTranslator
@@ -42,6 +49,16 @@ except ImportError:
     GoogleTranslator = None
     logger.warning("⚠️ Translator not available")
 
+try:
+    from lingua import Language, LanguageDetectorBuilder
+    LINGUA_AVAILABLE = True
+    logger.info("✅ Language detector available")
+except ImportError:
+    LINGUA_AVAILABLE = False
+    Language = None
+    LanguageDetectorBuilder = None
+    logger.warning("⚠️ Language detector not available")
+
 try:
     from bs4 import BeautifulSoup
     BS4_AVAILABLE = True
@@ -51,17 +68,55 @@ except ImportError:
     BeautifulSoup = None
     logger.warning("⚠️ BeautifulSoup not available")
 
-from functools import lru_cache
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+    logger.info("✅ selectolax available")
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    LexborHTMLParser = None
+    logger.warning("⚠️ selectolax not available, falling back to BeautifulSoup")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    logger.info("✅ orjson available")
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+    logger.warning("⚠️ orjson not available, using standard JSON responses")
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+    logger.info("✅ Redis client available")
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None
+    RedisError = Exception
+    logger.warning("⚠️ Redis client not available")
+
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+    logger.info("✅ cachetools available")
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+    TTLCache = None
+    logger.warning("⚠️ cachetools not available")
+
 from urllib.parse import urlparse, parse_qs
 
 # Environment variable checks with defaults
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
+REDIS_URL = os.getenv("REDIS_URL")
 
 # Model loading with error handling
 try:
-    model = joblib.load("model/fake_news_model.pkl")
-    vectorizer = joblib.load("model/vectorizer.pkl")
+    model = joblib.load("model/fake_news_model.pkl", mmap_mode="r")
+    vectorizer = joblib.load("model/vectorizer.pkl", mmap_mode="r")
     MODEL_LOADED = True
     logger.info("✅ ML model loaded successfully")
 except Exception as e:
@@ -70,6 +125,15 @@ except Exception as e:
     model = None
     vectorizer = None
 
+# Model capabilities, probed once at load instead of on every request
+HAS_COEF = MODEL_LOADED and hasattr(model, "coef_")
+HAS_PROBA = MODEL_LOADED and hasattr(model, "predict_proba")
+HAS_FEATURE_NAMES = MODEL_LOADED and hasattr(vectorizer, "get_feature_names_out")
+
+# Explainability lookups, computed once instead of on every request
+FEATURE_NAMES = vectorizer.get_feature_names_out() if HAS_FEATURE_NAMES else None
+COEF0 = model.coef_[0] if HAS_COEF else None
+
 # Gemini setup with fallback
 if GEMINI_AVAILABLE and GOOGLE_API_KEY:
     try:
@@ -87,6 +151,22 @@ else:
     if not GOOGLE_API_KEY:
         logger.warning("⚠️ No GOOGLE_API_KEY provided")
 
+# Language detection lets English input skip the translation round-trip
+if LINGUA_AVAILABLE:
+    try:
+        language_detector = LanguageDetectorBuilder.from_languages(
+            Language.ENGLISH, Language.HINDI, Language.BENGALI, Language.MARATHI,
+            Language.TAMIL, Language.TELUGU, Language.GUJARATI, Language.PUNJABI,
+            Language.URDU, Language.SPANISH, Language.FRENCH, Language.GERMAN,
+            Language.PORTUGUESE, Language.ARABIC, Language.CHINESE, Language.JAPANESE,
+            Language.RUSSIAN
+        ).build()
+    except Exception as e:
+        logger.error(f"❌ Language detector setup failed: {e}")
+        language_detector = None
+else:
+    language_detector = None
+
 # Class labels for UI controls
 try:
     if MODEL_LOADED and hasattr(model, "classes_"):
@@ -98,11 +178,52 @@ try:
 except Exception:
     CLASS_LABELS = ["FAKE", "REAL"]
 
+# Raw decision scores at or beyond this (and twice the margin) skip headlines and Gemini
+CONFIDENT_CUTOFF = float(os.getenv("CONFIDENT_CUTOFF", "2.0"))
+
+# Positive class used when the request does not specify one
+DEFAULT_POSITIVE_LABEL = CLASS_LABELS[1]
+
+# Shared HTTP client (created on startup so connections are pooled and kept alive)
+http_client = None
+
+# Shared Redis client for cross-worker caching (optional)
+redis_client = None
+
+@asynccontextmanager
+async def lifespan(app):
+    """Open the pooled HTTP and Redis clients on startup and close them on shutdown"""
+    global http_client, redis_client
+    if HTTPX_AVAILABLE:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=40),
+            timeout=10.0,
+            follow_redirects=True
+        )
+    if REDIS_AVAILABLE and REDIS_URL:
+        redis_client = aioredis.from_url(
+            REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    try:
+        yield
+    finally:
+        if http_client is not None:
+            await http_client.aclose()
+            http_client = None
+        if redis_client is not None:
+            await redis_client.aclose()
+            redis_client = None
+
 # FastAPI app
 app = FastAPI(
     title="Fake News Detector API",
     description="API for detecting fake news using machine learning",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # CORS middleware
@@ -125,6 +246,7 @@ class NewsAnalysisRequest(BaseModel):
     positiveLabel: str = "REAL"
     probThreshold: float = 0.6
     disableTranslation: bool = False
+    forceFull: bool = False
 
 class NewsAnalysisResponse(BaseModel):
     success: bool
@@ -133,55 +255,144 @@ class NewsAnalysisResponse(BaseModel):
     gemini_ready: bool
     error: str = None
 
-@lru_cache(maxsize=256)
-def safe_fetch_headlines(query):
+# Headline cache: Redis when configured, in-process TTL cache otherwise
+HEADLINE_CACHE_TTL = 600
+_headline_cache = TTLCache(maxsize=1024, ttl=HEADLINE_CACHE_TTL) if CACHETOOLS_AVAILABLE else None
+
+def headline_cache_key(query):
+    """Build a cache key that ignores case, word order and repeated words"""
+    norm_query = " ".join(sorted(set(query.lower().split())))
+    return "hl:" + hashlib.sha1(norm_query.encode("utf-8")).hexdigest()
+
+async def cache_get(key, local_cache):
+    """Read from Redis, falling back to the local cache when Redis is unreachable"""
+    if redis_client is not None:
+        try:
+            return await redis_client.get(key)
+        except (RedisError, OSError) as e:
+            logger.warning(f"⚠️ Redis get failed, using local cache: {e}")
+    if local_cache is not None:
+        return local_cache.get(key)
+    return None
+
+async def cache_set(key, value, ttl, local_cache):
+    """Write to Redis with a TTL, falling back to the local cache when Redis is unreachable"""
+    if redis_client is not None:
+        try:
+            await redis_client.set(key, value, ex=ttl)
+            return
+        except (RedisError, OSError) as e:
+            logger.warning(f"⚠️ Redis set failed, using local cache: {e}")
+    if local_cache is not None:
+        local_cache[key] = value
+
+# Translation cache: same Redis/local split as headlines, with a longer TTL
+TRANSLATION_CACHE_TTL = 24 * 60 * 60
+_translation_cache = TTLCache(maxsize=1024, ttl=TRANSLATION_CACHE_TTL) if CACHETOOLS_AVAILABLE else None
+
+async def safe_translate(text):
+    """Translate text to English, skipping English input and caching results"""
+    try:
+        if language_detector is not None:
+            language = await asyncio.to_thread(language_detector.detect_language_of, text)
+            if language == Language.ENGLISH:
+                return text
+
+        cache_key = "tr:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+        cached = await cache_get(cache_key, _translation_cache)
+        if cached is not None:
+            return cached
+
+        translated = await asyncio.to_thread(GoogleTranslator(source="auto", target="en").translate, text)
+        if not translated:
+            return text
+        await cache_set(cache_key, translated, TRANSLATION_CACHE_TTL, _translation_cache)
+        return translated
+    except Exception:
+        return text
+
+async def safe_fetch_headlines(query):
     """Safe headline fetching with comprehensive error handling"""
     if not query or not query.strip():
         return "(No query provided)"
         
-    if not REQUESTS_AVAILABLE:
-        return "(Headlines unavailable: requests library not available)"
+    if not HTTPX_AVAILABLE or http_client is None:
+        return "(Headlines unavailable: httpx library not available)"
         
     if not SERPAPI_KEY:
         return "(Headlines unavailable: missing SERPAPI_KEY environment variable)"
+
+    cache_key = headline_cache_key(query)
+    cached = await cache_get(cache_key, _headline_cache)
+    if cached is not None:
+        return cached
         
     try:
-        url = f"https://serpapi.com/search.json?q={requests.utils.quote(query)}&tbm=nws&api_key={SERPAPI_KEY}"
-        r = requests.get(url, timeout=10)
+        r = await http_client.get(
+            "https://serpapi.com/search.json",
+            params={"q": query, "tbm": "nws", "api_key": SERPAPI_KEY}
+        )
         r.raise_for_status()
         data = r.json()
         articles = data.get("news_results", [])[:5]
-        return "\n".join([f"- {a.get('title', 'Untitled')}" for a in articles]) if articles else "(No matching headlines)"
-    except requests.exceptions.Timeout:
+        headlines = "\n".join([f"- {a.get('title', 'Untitled')}" for a in articles]) if articles else "(No matching headlines)"
+    except httpx.TimeoutException:
         return "(Headlines unavailable: request timeout)"
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return f"(Headlines unavailable: network error - {str(e)})"
     except Exception as exc:
         return f"(Headlines unavailable: {str(exc)})"
 
-def safe_extract_url_text(url):
+    await cache_set(cache_key, headlines, HEADLINE_CACHE_TTL, _headline_cache)
+    return headlines
+
+# Cap on decoded page bytes read when scraping a URL
+MAX_PAGE_BYTES = 512 * 1024
+URL_FETCH_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "Mozilla/5.0 (compatible; FakeNewsDetector/1.0)"
+}
+
+def parse_html_text(html):
+    """Return the page title and paragraph texts, preferring the lexbor-backed selectolax parser"""
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else ""
+        paras = [p.text(separator=" ", strip=True) for p in tree.css("p")]
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+        title = soup.title.get_text(strip=True) if soup.title else ""
+        paras = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+    return title, paras
+
+async def safe_extract_url_text(url):
     """Safe URL text extraction with error handling"""
     if not url or not url.strip():
         return ""
         
-    if not REQUESTS_AVAILABLE:
-        return "(Install requests library for URL scraping)"
+    if not HTTPX_AVAILABLE or http_client is None:
+        return "(Install httpx library for URL scraping)"
         
-    if not BS4_AVAILABLE:
-        return "(Install beautifulsoup4 for URL scraping)"
+    if not SELECTOLAX_AVAILABLE and not BS4_AVAILABLE:
+        return "(Install selectolax or beautifulsoup4 for URL scraping)"
         
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        title = soup.title.get_text(strip=True) if soup.title else ""
-        paras = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+        buf = bytearray()
+        async with http_client.stream("GET", url, headers=URL_FETCH_HEADERS) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                buf += chunk
+                if len(buf) >= MAX_PAGE_BYTES:
+                    break
+            html = bytes(buf[:MAX_PAGE_BYTES]).decode(resp.encoding or "utf-8", errors="replace")
+        title, paras = parse_html_text(html)
         body = " ".join(paras)
         combined = (title + "\n\n" + body).strip()
         return combined[:8000] if combined else "⚠️ No text extracted from URL"
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return "❌ URL fetch timeout"
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return f"❌ URL fetch error: {str(e)}"
     except Exception as exc:
         return f"❌ URL processing error: {str(exc)}"
@@ -192,24 +403,68 @@ def safe_explain_prediction(vect, top_k=10):
         return "(Explainability unavailable: model not loaded)"
         
     try:
-        coef = getattr(model, "coef_", None)
-        feature_names = getattr(vectorizer, "get_feature_names_out", None)
-        
-        if coef is None or feature_names is None:
+        if not (HAS_COEF and HAS_FEATURE_NAMES):
             return "(Explainability unavailable for this model type)"
             
-        names = vectorizer.get_feature_names_out()
-        dense = vect.toarray()[0]
-        weights = coef[0]
-        contributions = dense * weights
-        top_idx = contributions.argsort()[-top_k:][::-1]
-        items = [f"{names[i]}: {contributions[i]:.3f}" for i in top_idx if dense[i] != 0.0]
+        # Only the non-zero terms of the sparse row can contribute
+        row = vect.tocsr()
+        contributions = row.data * COEF0[row.indices]
+        if contributions.size > top_k:
+            top_idx = np.argpartition(contributions, -top_k)[-top_k:]
+        else:
+            top_idx = np.arange(contributions.size)
+        top_idx = top_idx[np.argsort(-contributions[top_idx])]
+        items = [f"{FEATURE_NAMES[row.indices[i]]}: {contributions[i]:.3f}" for i in top_idx]
         return "Top contributing terms:\n" + ("\n".join(items) if items else "(No strong token contributions detected)")
         
     except Exception as exc:
         return f"(Explainability error: {str(exc)})"
 
-def safe_analyze_news(text, use_headlines=True, use_gemini=True, margin=0.5, sim_weight=0.5, positive_label=None, prob_threshold=0.6, disable_translation=False):
+def score_article(translated):
+    """Vectorize the article and score it with the model (runs on a worker thread)"""
+    vect = vectorizer.transform([translated])
+    raw_score = float(model.decision_function(vect)[0])
+    return vect, raw_score
+
+def headline_query(translated):
+    """Search query for related headlines: the first five words of the article"""
+    return " ".join(translated.split(maxsplit=5)[:5])
+
+def gemini_prompt(translated, headlines):
+    """Prompt asking Gemini to cross-check the article against the headlines"""
+    return f"User News:\n{translated}\n\nTop Headlines:\n{headlines}\n\nDoes this match? Explain clearly."
+
+async def safe_gemini_insight(translated, headlines, use_gemini=True):
+    """Safe Gemini cross-check of the article against the headlines"""
+    if not use_gemini or not GEMINI_READY:
+        return "(Gemini disabled or unavailable)"
+        
+    try:
+        response = await gemini.generate_content_async(gemini_prompt(translated, headlines))
+        return response.text
+    except Exception as e:
+        return f"❌ Gemini Error: {str(e)}"
+
+def sse_event(data, event=None):
+    """Format a Server-Sent Event, splitting multi-line data into data: fields"""
+    lines = [f"event: {event}"] if event else []
+    lines += [f"data: {line}" for line in str(data).split("\n")]
+    return "\n".join(lines) + "\n\n"
+
+async def stream_gemini_insight(translated, headlines):
+    """Yield the Gemini insight as Server-Sent Events while it is generated"""
+    if not GEMINI_READY:
+        yield sse_event("(Gemini disabled or unavailable)")
+    else:
+        try:
+            response = await gemini.generate_content_async(gemini_prompt(translated, headlines), stream=True)
+            async for chunk in response:
+                yield sse_event(chunk.text)
+        except Exception as e:
+            yield sse_event(f"❌ Gemini Error: {str(e)}", event="error")
+    yield sse_event("", event="done")
+
+async def safe_analyze_news(text, use_headlines=True, use_gemini=True, margin=0.5, sim_weight=0.5, positive_label=None, prob_threshold=0.6, disable_translation=False, force_full=False):
     """Safe news analysis with comprehensive error handling"""
     if not text or not text.strip():
         return "⚠️ Please enter news content.", "", "", "", "", ""
@@ -222,40 +477,37 @@ def safe_analyze_news(text, use_headlines=True, use_gemini=True, margin=0.5, sim
         if disable_translation or not TRANSLATOR_AVAILABLE:
             translated = text
         else:
-            try:
-                translated = GoogleTranslator(source="auto", target="en").translate(text)
-            except Exception:
-                translated = text
+            translated = await safe_translate(text)
 
-        # Vectorization
+        # Score the article first: confident predictions skip the slow external lookups
         try:
-            vect = vectorizer.transform([translated])
-        except Exception as e:
-            return f"❌ Text processing error: {str(e)}", "", "", "", "", ""
-
-        # Prediction
-        try:
-            raw_score = float(model.decision_function(vect)[0])
-            pred = model.predict(vect)[0]
-            raw_conf = abs(round(raw_score, 2))
+            vect, raw_score = await asyncio.to_thread(score_article, translated)
         except Exception as e:
             return f"❌ Prediction error: {str(e)}", "", "", "", "", ""
+        raw_conf = abs(round(raw_score, 2))
+        confident = not force_full and abs(raw_score) >= max(2.0 * float(margin), CONFIDENT_CUTOFF)
 
         # Headlines
-        headlines = safe_fetch_headlines(" ".join(translated.split()[:5])) if use_headlines else "(Headlines disabled)"
+        if confident:
+            headlines = "(Headlines skipped: model is confident)"
+        elif use_headlines:
+            headlines = await safe_fetch_headlines(headline_query(translated))
+        else:
+            headlines = "(Headlines disabled)"
+        has_headlines = use_headlines and headlines and not headlines.startswith("(")
+
+        # Gemini only needs the headlines, so start it before the remaining model work
+        gemini_task = None if confident else asyncio.create_task(safe_gemini_insight(translated, headlines, use_gemini))
 
         # Similarity calculation
         sim_value = None
-        if use_headlines and headlines and not headlines.startswith("("):
+        if has_headlines:
             try:
-                clean_headlines = headlines.replace("- ", " ")
-                h_vec = vectorizer.transform([clean_headlines])
-                a = vect.toarray()[0]
-                b = h_vec.toarray()[0]
-                a_norm = (a @ a) ** 0.5
-                b_norm = (b @ b) ** 0.5
+                h_vec = vectorizer.transform([headlines.replace("- ", " ")])
+                a_norm = sparse_norm(vect)
+                b_norm = sparse_norm(h_vec)
                 if a_norm > 0 and b_norm > 0:
-                    sim_value = float((a @ b) / (a_norm * b_norm))
+                    sim_value = float((vect @ h_vec.T)[0, 0] / (a_norm * b_norm))
                 else:
                     sim_value = 0.0
             except Exception:
@@ -269,59 +521,44 @@ def safe_analyze_news(text, use_headlines=True, use_gemini=True, margin=0.5, sim
         adjusted_score = raw_score * factor
         adjusted_conf = abs(round(adjusted_score, 2))
 
+        # Positive/other labels resolved once per request
+        pos_label = positive_label or DEFAULT_POSITIVE_LABEL
+        pos_index = CLASS_LABELS.index(pos_label) if pos_label in CLASS_LABELS else 1
+        other_label = CLASS_LABELS[1 - pos_index]
+
         # Probability computation
-        try:
-            model_classes = [str(c) for c in getattr(model, "classes_", ["FAKE", "REAL"])]
-            pos_label = positive_label or (model_classes[1] if len(model_classes) > 1 else model_classes[0])
-            
-            if hasattr(model, "predict_proba"):
+        prob_raw = None
+        prob_adj = None
+        if HAS_PROBA:
+            try:
                 proba = model.predict_proba(vect)[0]
-                pos_index = model_classes.index(pos_label) if pos_label in model_classes else 1
                 prob_raw = float(proba[pos_index])
-            else:
-                import math
-                sigmoid = 1.0 / (1.0 + math.exp(-raw_score))
-                if pos_label == (model_classes[1] if len(model_classes) > 1 else model_classes[0]):
-                    prob_raw = float(sigmoid)
-                else:
-                    prob_raw = float(1.0 - sigmoid)
+
+                sig_adj = expit(adjusted_score)
+                prob_adj = float(sig_adj) if pos_index == 1 else float(1.0 - sig_adj)
                     
-            sigmoid_adj = 1.0 / (1.0 + math.exp(-adjusted_score))
-            if pos_label == (model_classes[1] if len(model_classes) > 1 else model_classes[0]):
-                prob_adj = float(sigmoid_adj)
-            else:
-                prob_adj = float(1.0 - sigmoid_adj)
-                
-        except Exception:
-            prob_raw = None
-            prob_adj = None
+            except Exception:
+                prob_raw = None
+                prob_adj = None
 
         # Final decision
-        final_label = pred
-        model_classes = [str(c) for c in getattr(model, "classes_", ["FAKE", "REAL"])]
-        other_label = model_classes[0] if (positive_label or (len(model_classes) > 1 and model_classes[1])) != model_classes[0] else (model_classes[1] if len(model_classes) > 1 else model_classes[0])
-        chosen_positive = (positive_label or (model_classes[1] if len(model_classes) > 1 else model_classes[0]))
-        
         if prob_adj is not None:
-            final_label = chosen_positive if prob_adj >= float(prob_threshold) else other_label
+            final_label = pos_label if prob_adj >= float(prob_threshold) else other_label
         else:
-            final_label = chosen_positive if adjusted_score >= 0 else other_label
+            final_label = pos_label if adjusted_score >= 0 else other_label
             
         if abs(adjusted_score) < float(margin):
             final_label = "UNSURE"
 
-        # Gemini response
-        if use_gemini and GEMINI_READY:
-            try:
-                prompt = f"User News:\n{translated}\n\nTop Headlines:\n{headlines}\n\nDoes this match? Explain clearly."
-                gemini_response = gemini.generate_content(prompt).text
-            except Exception as e:
-                gemini_response = f"❌ Gemini Error: {str(e)}"
+        # Explanation runs on a worker thread while Gemini is in flight
+        if gemini_task is not None:
+            explanation, gemini_response = await asyncio.gather(
+                asyncio.to_thread(safe_explain_prediction, vect),
+                gemini_task
+            )
         else:
-            gemini_response = "(Gemini disabled or unavailable)"
-
-        # Explanation
-        explanation = safe_explain_prediction(vect)
+            explanation = safe_explain_prediction(vect)
+            gemini_response = "(Gemini skipped: model is confident)"
 
         return (
             f"🧠 Prediction: {final_label}",
@@ -356,13 +593,13 @@ async def analyze_news(request: NewsAnalysisRequest):
         # Get text from URL if provided
         text = request.text
         if request.url and not text:
-            text = safe_extract_url_text(request.url)
+            text = await safe_extract_url_text(request.url)
         
         if not text:
             raise HTTPException(status_code=400, detail="No text content provided")
         
         # Analyze the news
-        result = safe_analyze_news(
+        result = await safe_analyze_news(
             text=text,
             use_headlines=request.useHeadlines,
             use_gemini=request.useGemini,
@@ -370,7 +607,8 @@ async def analyze_news(request: NewsAnalysisRequest):
             sim_weight=request.simWeight,
             positive_label=request.positiveLabel,
             prob_threshold=request.probThreshold,
-            disable_translation=request.disableTranslation
+            disable_translation=request.disableTranslation,
+            force_full=request.forceFull
         )
         
         return NewsAnalysisResponse(
@@ -390,6 +628,28 @@ async def analyze_news(request: NewsAnalysisRequest):
             error=str(e)
         )
 
+@app.post("/analyze/gemini-stream")
+async def stream_gemini(request: NewsAnalysisRequest):
+    """Stream the Gemini insight for news content as Server-Sent Events"""
+    text = request.text
+    if request.url and not text:
+        text = await safe_extract_url_text(request.url)
+    
+    if not text or not text.strip():
+        raise HTTPException(status_code=400, detail="No text content provided")
+    
+    if request.disableTranslation or not TRANSLATOR_AVAILABLE:
+        translated = text
+    else:
+        translated = await safe_translate(text)
+    headlines = await safe_fetch_headlines(headline_query(translated)) if request.useHeadlines else "(Headlines disabled)"
+    
+    return StreamingResponse(
+        stream_gemini_insight(translated, headlines),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @app.get("/health")
 async def health_check():
     """Detailed health check endpoint"""
@@ -397,9 +657,12 @@ async def health_check():
         "status": "healthy",
         "model_loaded": MODEL_LOADED,
         "gemini_ready": GEMINI_READY,
-        "requests_available": REQUESTS_AVAILABLE,
+        "httpx_available": HTTPX_AVAILABLE,
+        "redis_configured": redis_client is not None,
         "translator_available": TRANSLATOR_AVAILABLE,
+        "language_detector_ready": language_detector is not None,
         "bs4_available": BS4_AVAILABLE,
+        "selectolax_available": SELECTOLAX_AVAILABLE,
         "google_api_key": bool(GOOGLE_API_KEY),
         "serpapi_key": bool(SERPAPI_KEY)
     }
@@ -0,0 +1,23 @@
+"""
+Gunicorn settings for production
+Runs the FastAPI app on uvicorn workers (uvloop event loop + httptools parser)
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# One worker per core unless WEB_CONCURRENCY overrides it
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# UvicornWorker picks uvloop and httptools automatically when they are installed
+worker_class = "uvicorn.workers.UvicornWorker"
+
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
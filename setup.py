@@ -8,15 +8,23 @@ setup(
     packages=find_packages(),
     install_requires=[
         "fastapi>=0.104.1",
+        "orjson>=3.9.10",
         "uvicorn[standard]>=0.24.0",
+        "gunicorn>=21.2.0",
+        "uvloop>=0.19.0",
+        "httptools>=0.6.1",
         "scikit-learn>=1.3.2",
         "pandas>=2.1.4",
         "joblib>=1.3.2",
-        "requests>=2.31.0",
+        "httpx>=0.25.2",
+        "redis>=5.0.1",
+        "cachetools>=5.3.2",
         "python-dotenv>=1.0.0",
         "google-generativeai>=0.3.2",
         "deep-translator>=1.11.4",
+        "lingua-language-detector>=2.0.2",
         "beautifulsoup4>=4.12.2",
+        "selectolax>=0.3.17",
         "numpy>=1.24.3",
         "scipy>=1.11.4",
         "pydantic>=2.5.0",
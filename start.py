@@ -35,7 +35,8 @@ def main():
     # Check environment variables
     env_vars = {
         "GOOGLE_API_KEY": "Google Gemini AI API key (optional)",
-        "SERPAPI_KEY": "SerpAPI key for headlines (optional)"
+        "SERPAPI_KEY": "SerpAPI key for headlines (optional)",
+        "REDIS_URL": "Redis URL for the shared headline cache (optional)"
     }
     
     print("\n🔑 Environment Variables:")
@@ -46,21 +47,30 @@ def main():
         else:
             print(f"  ⚠️  {var}: Not set ({description})")
     
-    # Get port from environment or use default
+    # Get port and environment (dev reloads on changes, prod runs under gunicorn)
     port = int(os.getenv("PORT", 8000))
+    env = os.getenv("ENV", "dev").lower()
     
-    print(f"\n🚀 Starting Fake News Detector API on port {port}")
+    print(f"\n🚀 Starting Fake News Detector API on port {port} ({env})")
     print(f"📱 Frontend will be available at: http://localhost:{port}")
     print(f"🔍 API documentation at: http://localhost:{port}/docs")
     print(f"❤️  Health check at: http://localhost:{port}/health")
     print("\nPress Ctrl+C to stop the server")
     
+    if env == "prod":
+        # Replace this process with gunicorn managing one uvicorn worker per core
+        try:
+            os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn_conf.py", "app:app"])
+        except OSError as e:
+            print(f"\n❌ Error starting gunicorn: {e}")
+            sys.exit(1)
+    
     try:
         uvicorn.run(
             "app:app",
             host="0.0.0.0",
             port=port,
-            reload=True,
+            reload=(env == "dev"),
             log_level="info"
         )
     except KeyboardInterrupt:
@@ -1,7 +1,7 @@
-import pandas as pd, os, joblib
+import pandas as pd, numpy as np, os, joblib
 from sklearn.model_selection import train_test_split
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import PassiveAggressiveClassifier
+from sklearn.linear_model import LogisticRegression
 
 os.makedirs("model", exist_ok=True)
 
@@ -18,13 +18,18 @@ data = {
 df = pd.DataFrame(data)
 X_train, X_test, y_train, y_test = train_test_split(df["text"], df["label"], test_size=0.2, random_state=42)
 
-vectorizer = TfidfVectorizer(stop_words="english", max_df=0.8)
+vectorizer = TfidfVectorizer(stop_words="english", max_df=0.8, dtype=np.float32)
 X_train_tfidf = vectorizer.fit_transform(X_train)
 
-model = PassiveAggressiveClassifier(max_iter=1000)
+model = LogisticRegression(solver="liblinear", C=1.0)
 model.fit(X_train_tfidf, y_train)
 
-joblib.dump(model, "model/fake_news_model.pkl")
-joblib.dump(vectorizer, "model/vectorizer.pkl")
+# float32 weights match the vectorizer output and halve memory traffic at inference
+model.coef_ = model.coef_.astype(np.float32)
+model.intercept_ = model.intercept_.astype(np.float32)
+
+# Uncompressed dumps so the app can memory-map the arrays (shared across workers)
+joblib.dump(model, "model/fake_news_model.pkl", compress=0)
+joblib.dump(vectorizer, "model/vectorizer.pkl", compress=0)
 
 print("✅ Model saved in /model")
\ No newline at end of file